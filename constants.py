@@ -1 +1,3 @@
-CREDENTIAL_FILE = 'credentials.json'
\ No newline at end of file
+CREDENTIAL_FILE = 'credentials.json'
+CONFIG_FILE = 'config.json'
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
\ No newline at end of file
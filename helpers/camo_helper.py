@@ -1,7 +1,35 @@
+import atexit
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
 
+# Geçici bağlantı kopmaları ve sunucu hatalarında bir sonraki döngüyü beklemeden isteği tekrarla.
+# Retry-After başlığı dikkate alınmaz; aksi halde 503 yanıtındaki sınırsız bir bekleme
+# süresi zamanlayıcıyı kilitleyebilir, bekleme yalnızca backoff_factor ile sınırlı kalır.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset(['GET']),
+    respect_retry_after_header=False
+)
+
+# Her döngüde yeni bağlantı (TCP + TLS el sıkışması) kurmamak için tek bir oturum kullanılır
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = "git_hit_monitor"
+_SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=2, max_retries=_RETRY))
+atexit.register(_SESSION.close)
+
+# İçeriği yalnızca sayıdan oluşan ilk SVG text elemanını doğrudan baytlar üzerinde yakalar
+_NUM_RE = re.compile(rb'<text[^>]*>\s*([\d,.Kk]+)\s*</text>')
+
+# BeautifulSoup yedek yolunda text elemanlarının içindeki sayısal değeri bulur
+_DIGIT_RE = re.compile(r'[\d,.Kk]+')
+
+# URL başına son başarılı yanıtın doğrulayıcıları (ETag / Last-Modified) ve ayrıştırılan sayı
+_LAST_RESPONSES: dict[str, dict[str, str]] = {}
+
 def get_number_from_url(url: str) -> tuple[str, bool]:
     """
     Verilen URL'ye istek atar ve içeriğindeki tüm SVG text elemanlarından sayıyı döndürür.
@@ -14,25 +42,112 @@ def get_number_from_url(url: str) -> tuple[str, bool]:
         bool: İşlem başarılı olursa True, aksi halde False.
     """
     try:
-        # URL'ye istek at
-        response = requests.get(url)
+        # URL'ye istek at, daha önce yanıt alındıysa koşullu istek gönder
+        last_response = _LAST_RESPONSES.get(url)
+        # Gövde tamamen okunur; yarıda bırakılan yanıt bağlantının kapanmasına ve
+        # sonraki döngüde yeniden TCP + TLS el sıkışması yapılmasına neden olur
+        response = _SESSION.get(url, headers=build_conditional_headers(last_response), timeout=(3, 10))
         response.raise_for_status()  # İstek başarısız olursa hata fırlatır
 
-        # HTML içeriğini işle
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # İçerik değişmediyse (304) ayrıştırma yapmadan önceki sayıyı döndür
+        if response.status_code == 304 and last_response is not None:
+            return last_response['number'], True
 
-        # Tüm text elemanlarını bul
-        text_elements = soup.find_all('text')
+        number, is_successful = find_number_in_content(response.content)
+        if is_successful:
+            remember_response(url, response.headers, number)
+        return number, is_successful
 
-        # Her bir text elemanını kontrol et
-        for text_element in text_elements:
-            if text_element and text_element.text:
-                # Sayısal bir değer içerip içermediğini kontrol et
-                match = re.search(r'[\d,.Kk]+', text_element.text)
-                if match:
-                    return match.group().strip(), True
+    except requests.exceptions.RequestException as e:
+        return f"HTTP isteği başarısız: {e}", False
 
-        return "Belirtilen SVG text elemanı bulunamadı.", False
+def build_conditional_headers(last_response: dict[str, str] | None) -> dict[str, str]:
+    """
+    Önceki yanıtın doğrulayıcılarından koşullu istek başlıklarını oluşturur.
 
-    except requests.exceptions.RequestException as e:
-        return f"HTTP isteği başarısız: {e}", False
\ No newline at end of file
+    Args:
+        last_response (dict[str, str] | None): Aynı URL için saklanan son yanıt bilgileri.
+
+    Returns:
+        dict[str, str]: If-None-Match / If-Modified-Since başlıkları (yoksa boş sözlük).
+    """
+    headers = {}
+    if last_response:
+        if 'etag' in last_response:
+            headers['If-None-Match'] = last_response['etag']
+        if 'last_modified' in last_response:
+            headers['If-Modified-Since'] = last_response['last_modified']
+    return headers
+
+def remember_response(url: str, response_headers: dict, number: str) -> None:
+    """
+    Yanıtın doğrulayıcılarını ve ayrıştırılan sayıyı sonraki koşullu istek için saklar.
+
+    Args:
+        url (str): İstek atılan URL.
+        response_headers (dict): Yanıt başlıkları.
+        number (str): Yanıttan ayrıştırılan sayı.
+
+    Returns:
+        None
+    """
+    last_response = {'number': number}
+    if response_headers.get('ETag'):
+        last_response['etag'] = response_headers['ETag']
+    if response_headers.get('Last-Modified'):
+        last_response['last_modified'] = response_headers['Last-Modified']
+    _LAST_RESPONSES[url] = last_response
+
+def find_number_in_content(content: bytes) -> tuple[str, bool]:
+    """
+    Yanıt içeriğindeki SVG text elemanlarından sayıyı çıkarır.
+
+    Args:
+        content (bytes): Yanıtın gövdesi.
+
+    Returns:
+        str: İlk bulunan SVG text elemanındaki sayı.
+        bool: İşlem başarılı olursa True, aksi halde False.
+    """
+    # Hızlı yol: sayıyı ağaç oluşturmadan doğrudan baytlarda ara
+    match = _NUM_RE.search(content)
+    if match:
+        return match.group(1).decode('ascii').strip(), True
+
+    # Regex eşleşmezse içeriği BeautifulSoup ile işle
+    return find_number_with_soup(content)
+
+def find_number_with_soup(content: bytes) -> tuple[str, bool]:
+    """
+    Yanıt içeriğini BeautifulSoup ile işler ve SVG text elemanlarındaki ilk sayıyı döndürür.
+    Regex ile sayı bulunamadığında yedek yol olarak kullanılır.
+
+    Args:
+        content (bytes): İşlenecek HTML/SVG içeriği.
+
+    Returns:
+        str: İlk bulunan SVG text elemanındaki sayı.
+        bool: İşlem başarılı olursa True, aksi halde False.
+    """
+    # BeautifulSoup yalnızca yedek yolda gerektiği için burada içe aktarılır
+    from bs4 import BeautifulSoup, SoupStrainer, FeatureNotFound
+
+    # HTML içeriğini işle, ağaçta yalnızca text elemanları oluşturulsun
+    # (lxml kurulu değilse döngünün durmaması için yerleşik ayrıştırıcıya geri dönülür)
+    try:
+        soup = BeautifulSoup(content, 'lxml', parse_only=SoupStrainer('text'))
+    except FeatureNotFound:
+        soup = BeautifulSoup(content, 'html.parser', parse_only=SoupStrainer('text'))
+
+    # Tüm text elemanlarını bul
+    text_elements = soup.find_all('text')
+
+    # Her bir text elemanını kontrol et
+    for text_element in text_elements:
+        if text_element and text_element.text:
+            # Sayısal bir değer içerip içermediğini kontrol et
+            match = _DIGIT_RE.search(text_element.text)
+            if match:
+                return match.group().strip(), True
+
+    return "Belirtilen SVG text elemanı bulunamadı.", False
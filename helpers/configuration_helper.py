@@ -1,12 +1,32 @@
+import functools
+import os
 from .json_helper import load_config_from_json
+from constants import CONFIG_FILE
+
 def load_configuration():
     """
     Yapılandırma dosyasını yükler ve gerekli değerleri döndürür.
+    Dosya değişmediği sürece önbellekteki değerler kullanılır.
     """
-    config = load_config_from_json('config.json')
+    # Değiştirilme zamanı anahtara dahil edildiği için dosya güncellenince yeniden okunur
+    return _load_configuration(CONFIG_FILE, os.path.getmtime(CONFIG_FILE))
+
+@functools.lru_cache(maxsize=1)
+def _load_configuration(file_path: str, mtime: float) -> tuple:
+    """
+    Belirtilen yapılandırma dosyasını okur ve gerekli değerleri döndürür.
+
+    Args:
+        file_path (str): Yapılandırma dosyasının yolu.
+        mtime (float): Dosyanın değiştirilme zamanı (önbellek anahtarı olarak kullanılır).
+
+    Returns:
+        tuple: spreadsheet_name, interval_seconds, camo_url ve writer_emails değerleri.
+    """
+    config = load_config_from_json(file_path)
     return (
         config['spreadsheet_name'],
         config.get('interval_seconds', 240),
         config['camo_url'],
         config['writer_emails']
-    )
\ No newline at end of file
+    )
@@ -1,4 +1,11 @@
-import json
+import math
+
+try:
+    # orjson varsa daha hızlı olan bu ayrıştırıcı kullanılır
+    import orjson
+except ImportError:
+    orjson = None
+    import json
 
 def load_config_from_json(file_path: str) -> dict:
     """
@@ -10,6 +17,48 @@ def load_config_from_json(file_path: str) -> dict:
     Returns:
         dict: Yapılandırma bilgilerini içeren sözlük.
     """
+    if orjson is not None:
+        # orjson baytlarla çalıştığı için dosya ikili kipte okunur
+        with open(file_path, 'rb') as config_file:
+            return orjson.loads(config_file.read())
+
     with open(file_path, 'r') as config_file:
         config = json.load(config_file)
-    return config
\ No newline at end of file
+    return config
+
+def dump_json_bytes(data) -> bytes:
+    """
+    Verilen veriyi UTF-8 kodlanmış JSON baytlarına dönüştürür.
+
+    Args:
+        data: JSON'a dönüştürülecek veri (sözlük, liste vb.).
+
+    Returns:
+        bytes: JSON içeriği.
+    """
+    if orjson is not None:
+        # orjson doğrudan bayt üretir, ayrıca kodlama adımı gerekmez
+        return orjson.dumps(data)
+
+    # json modülü NaN/Infinity değerlerini geçersiz JSON olarak yazar; orjson ile aynı çıktıyı
+    # üretmek için bu değerler null'a çevrilir
+    return json.dumps(replace_non_finite(data), ensure_ascii=False, separators=(',', ':'),
+                      allow_nan=False).encode('utf-8')
+
+def replace_non_finite(data):
+    """
+    Veri içindeki NaN ve sonsuz float değerlerini özyinelemeli olarak None ile değiştirir.
+
+    Args:
+        data: İşlenecek veri (sözlük, liste, float vb.).
+
+    Returns:
+        Sonlu olmayan float değerleri None ile değiştirilmiş veri.
+    """
+    if isinstance(data, float):
+        return data if math.isfinite(data) else None
+    if isinstance(data, dict):
+        return {key: replace_non_finite(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [replace_non_finite(value) for value in data]
+    return data
@@ -1,10 +1,204 @@
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+import io
 import os
+import atexit
+import signal
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
 from abc import ABC, abstractmethod
 from . import process_data_helper
-import matplotlib.dates as mdates
-from matplotlib.ticker import FixedLocator
+from .json_helper import dump_json_bytes
+
+# matplotlib, ilk grafik çizilene kadar yüklenmez; grafikleri alt süreçler çizdiği için
+# ana süreç matplotlib'i hiç yüklemez
+
+# X ekseni etiketine göre tarih biçimi, etiket dönüşü, yatay hizalama ve eksen kenar payı (gün)
+_X_AXIS_FORMATS = {
+    'Yıl': ('%Y', 0, 'center', 366),  # Bir yıl için
+    'Ay': ('%Y-%m', 45, 'right', 31),  # Bir ay için
+}
+_DEFAULT_X_AXIS_FORMAT = ('%Y-%m-%d', 45, 'right', 1)  # Bir gün için
+
+# Grafiklerin varsayılan kayıt biçimi; dosya adı verinin boyutuna göre değişmez, PNG isteğe bağlıdır
+_DEFAULT_SAVE_FORMAT = "svg"
+
+# Bu sayıdan fazla nokta içeren grafiklerde veri çizgisi SVG'ye her noktası ayrı bir XML öğesi
+# olarak değil, tek bir raster görüntü olarak gömülür
+_RASTER_POINT_THRESHOLD = 2000
+
+# Bu sayıdan fazla nokta içeren çizgi grafiklerinde noktalar işaretlenmez
+# (her işaret ayrı çizildiği için yoğun grafiklerde çizim süresini ve dosya boyutunu büyütür)
+_MARKER_POINT_THRESHOLD = 500
+
+# Grafikler çizilirken geçici olarak uygulanan matplotlib ayarları:
+# SVG'de yazılar glif yolları yerine metin olarak saklanır (dosya boyutu ~%30 küçülür),
+# PNG'de çok uzun çizgiler Agg'nin sınırına takılmasın diye parçalar halinde çizilir
+_RC_PARAMS = {
+    'svg.fonttype': 'none',
+    'agg.path.chunksize': 10000
+}
+
+# X ekseninde gösterilecek en fazla tik sayısı; daha fazla nokta varsa tikleri matplotlib seçer
+_MAX_X_TICKS = 30
+
+# Periyotlara göre grafikte gösterilen tıklanma sütunu
+# (calculate_all_period_clicks sonuçları da bu sütun adlarıyla döndürür)
+_PERIOD_COLUMNS = {
+    'günlük': 'daily_clicks',
+    'aylık': 'monthly_clicks',
+    'çeyreklik': 'quarterly_clicks',
+    'yıllık': 'yearly_clicks'
+}
+
+# Grafikleri çizen süreç havuzu; her döngüde yeniden başlatılmaması için ilk kullanımda oluşturulur
+_EXECUTOR = None
+
+# Havuzdaki en fazla alt süreç sayısı; her boşta bekleyen alt süreç matplotlib ile birlikte
+# yaklaşık 100 MB bellek tuttuğundan her periyoda (len(_PERIOD_COLUMNS)) ayrı süreç açılmaz
+_MAX_PLOT_WORKERS = 2
+
+# Grafik dosya yoluna (uzantısız) göre son çizilen periyot verisi; verisi değişmeyen grafikler yeniden çizilmez
+_LAST_PLOTTED_DFS: dict[str, pd.DataFrame] = {}
+
+def to_datetime_index(index: pd.Index) -> pd.DatetimeIndex:
+    """
+    Verilen indeksi DatetimeIndex'e dönüştüren fonksiyon.
+    İndeks zaten DatetimeIndex ise dönüştürme yapılmadan aynen döndürülür.
+
+    Args:
+        index (pd.Index): Dönüştürülecek indeks
+
+    Returns:
+        pd.DatetimeIndex: Datetime tipindeki indeks
+    """
+    if isinstance(index, pd.DatetimeIndex):
+        return index
+    if isinstance(index, pd.PeriodIndex):
+        return index.to_timestamp()
+    # DatetimeIndex yapıcısı dizeleri genel pd.to_datetime yolundan geçmeden doğrudan dönüştürür
+    return pd.DatetimeIndex(index)
+
+def save_figure(fig, file_path: str, save_format: str) -> None:
+    """
+    Figure'ı önce bellekte oluşturup dosyaya tek seferde yazan fonksiyon.
+
+    Args:
+        fig: Matplotlib figure nesnesi
+        file_path (str): Kaydedilecek dosyanın yolu
+        save_format (str): Kayıt biçimi ('svg', 'png' vb.)
+
+    Returns:
+        None
+    """
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=save_format)
+    write_file_atomically(file_path, buffer.getbuffer())
+
+def write_file_atomically(file_path: str, data: bytes) -> None:
+    """
+    Veriyi dosyaya tek seferde yazan fonksiyon.
+    Dosya geçici bir adla yazılıp yerine taşındığı için okuyucular hiçbir zaman yarım dosya görmez.
+
+    Args:
+        file_path (str): Yazılacak dosyanın yolu
+        data (bytes): Yazılacak veri
+
+    Returns:
+        None
+    """
+    temp_path = file_path + ".tmp"
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(temp_path, flags, 0o644)
+    try:
+        data = memoryview(data)
+        # os.write verinin tamamını tek çağrıda yazmayabilir, kalan kısım için devam et
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+    os.replace(temp_path, file_path)
+
+def resolve_save_format(save_format: str | None) -> str:
+    """
+    Grafiğin kayıt biçimini belirleyen fonksiyon.
+
+    Args:
+        save_format (str | None): İstenen kayıt biçimi; verilmezse varsayılan biçim ('svg') kullanılır
+
+    Returns:
+        str: Kayıt biçimi ('svg', 'png' vb.)
+    """
+    return save_format if save_format is not None else _DEFAULT_SAVE_FORMAT
+
+def get_plot_path(plot_dir: str, period: str) -> str:
+    """
+    Periyot grafiğinin kaydedileceği dosya yolunu (uzantısız) döndüren fonksiyon.
+
+    Args:
+        plot_dir (str): Grafiklerin kaydedileceği dizin
+        period (str): Grafik periyodu
+
+    Returns:
+        str: Uzantısız dosya yolu
+    """
+    return os.path.join(plot_dir, f"{period}_clicks")
+
+def is_plot_up_to_date(fig_name: str, period_df: pd.DataFrame, export_json: bool, save_format: str | None) -> bool:
+    """
+    Grafiğin son çizildiği veriyle aynı veriye sahip olup olmadığını ve dosyalarının hâlâ
+    yerinde durup durmadığını kontrol eden fonksiyon.
+
+    Args:
+        fig_name (str): Grafiğin dosya yolu (uzantısız)
+        period_df (pd.DataFrame): Çizilecek periyot verisi
+        export_json (bool): Grafiğin verisinin .json dosyasına da yazılıp yazılmadığı
+        save_format (str | None): Grafiğin kayıt biçimi
+
+    Returns:
+        bool: Grafik yeniden çizilmeye gerek yoksa True, aksi halde False
+    """
+    last_df = _LAST_PLOTTED_DFS.get(fig_name)
+    if last_df is None or not last_df.equals(period_df):
+        return False
+    if not os.path.exists(f"{fig_name}.{resolve_save_format(save_format)}"):
+        return False
+    return not export_json or os.path.exists(fig_name + ".json")
+
+def export_plot_data(df: pd.DataFrame, y_column: str) -> dict:
+    """
+    Grafiğin istemci tarafında (ör. Plotly.js) çizilebilmesi için verisini sade bir sözlüğe dönüştüren fonksiyon.
+
+    Args:
+        df (pd.DataFrame): Grafiği çizilecek veriyi içeren DataFrame
+        y_column (str): Y ekseninde gösterilecek sütunun adı
+
+    Returns:
+        dict: Tarihler ('x'), değerler ('y') ve ortalama ('mean') değerini içeren sözlük;
+            tüm değerler eksikse ortalama None olur
+    """
+    y_values = df[y_column].to_numpy()
+    # Tüm değerler NaN ise nanmean uyarı verip NaN döndüreceğinden ortalama hesaplanmaz
+    mean_value = None if np.isnan(y_values).all() else float(np.nanmean(y_values))
+    return {
+        "x": to_datetime_index(df.index).strftime('%Y-%m-%d').tolist(),
+        "y": y_values.tolist(),
+        "mean": mean_value
+    }
+
+def save_json(file_path: str, data: dict) -> None:
+    """
+    Veriyi JSON olarak dosyaya tek seferde yazan fonksiyon.
+
+    Args:
+        file_path (str): Kaydedilecek dosyanın yolu
+        data (dict): Kaydedilecek veri
+
+    Returns:
+        None
+    """
+    write_file_atomically(file_path, dump_json_bytes(data))
 
 class GraphPlotter(ABC):
     def __init__(self, df: pd.DataFrame, title: str, y_column: str, x_label: str) -> None:
@@ -24,6 +218,12 @@ class GraphPlotter(ABC):
         self.title = title
         self.y_column = y_column
         self.x_label = x_label
+        # X ekseni için datetime indeksi bir kez hesaplanır; df'nin indeksi değiştirilmez
+        self.x_index = to_datetime_index(df.index)
+        import matplotlib.dates as mdates
+        # Matplotlib'in anlayacağı sayısal tarih değerleri de bir kez hesaplanır;
+        # datetime64 dizisi date2num'un vektörel yolundan geçer
+        self.date_numbers = mdates.date2num(self.x_index.to_numpy())
 
     @abstractmethod
     def plot(self, fig_name: str) -> None:
@@ -52,49 +252,91 @@ class GraphPlotter(ABC):
         ax.set_xlabel(self.x_label)
         ax.set_ylabel('Tıklanma Sayısı')
         ax.grid(True)
-        plt.tight_layout()
 
 class LineGraphPlotter(GraphPlotter):
-    def plot(self, fig_name: str, save_format: str = "svg") -> None:
-        fig, ax = plt.subplots(figsize=(12, 6))
+    # Her çizimde yeni Figure oluşturmamak için süreç başına tek bir Figure/Axes çifti kullanılır
+    _fig = None
+    _ax = None
 
-        # İndeksin tipini kontrol et ve datetime tipine dönüştür
-        if isinstance(self.df.index, pd.PeriodIndex):
-            self.df.index = self.df.index.to_timestamp()
-        elif not isinstance(self.df.index, pd.DatetimeIndex):
-            self.df.index = pd.to_datetime(self.df.index)
+    @classmethod
+    def _get_figure(cls) -> tuple:
+        """
+        Süreç içinde paylaşılan Figure/Axes çiftini temizleyip döndüren yardımcı metot.
+        İlk çağrıda çifti oluşturur.
 
-        # İndeks değerlerini Matplotlib'in anlayacağı float tipine dönüştür
-        date_numbers = mdates.date2num(self.df.index)
+        Returns:
+            tuple: Matplotlib figure ve axes nesneleri
+        """
+        import matplotlib
+        if cls._fig is None:
+            # Figure pyplot'un global kaydına girmeden doğrudan Agg tuvaline bağlanır;
+            # böylece pyplot ve etkileşimli arka uçlar hiç yüklenmez
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            fig = Figure(figsize=(12, 6))
+            FigureCanvasAgg(fig)
+            LineGraphPlotter._fig, LineGraphPlotter._ax = fig, fig.subplots()
+        # Önceki çizimden kalan çizgileri, eksen biçimlerini ve açıklamayı temizle
+        cls._ax.clear()
+        # tight_layout önceki çizimin kenar boşluklarından başlamasın diye varsayılanlara dön
+        cls._fig.subplots_adjust(**{
+            param: matplotlib.rcParams[f'figure.subplot.{param}']
+            for param in ('left', 'right', 'bottom', 'top', 'wspace', 'hspace')
+        })
+        return cls._fig, cls._ax
+
+    def plot(self, fig_name: str, save_format: str | None = None) -> None:
+        """
+        Çizgi grafiğini çizen ve kaydeden metot.
 
-        if len(self.df) > 1:
-            ax.plot(date_numbers, self.df[self.y_column], marker='o', label='Veri')
+        Args:
+            fig_name (str): Kaydedilecek dosyanın yolu (uzantısız)
+            save_format (str | None): Kayıt biçimi; verilmezse 'svg' kullanılır
+
+        Returns:
+            None
+        """
+        save_format = resolve_save_format(save_format)
+
+        date_format, rotation, ha, offset = _X_AXIS_FORMATS.get(self.x_label, _DEFAULT_X_AXIS_FORMAT)
+
+        # Y değerleri pandas indeksleme yükü olmadan bir kez NumPy dizisi olarak alınır
+        y_values = self.df[self.y_column].to_numpy()
+
+        fig, ax = self._get_figure()
+        from matplotlib.ticker import FixedLocator, FixedFormatter
+        from matplotlib.dates import AutoDateLocator, DateFormatter
+
+        date_numbers = self.date_numbers
+
+        if len(y_values) > _MARKER_POINT_THRESHOLD:
+            ax.plot(date_numbers, y_values, label='Veri', rasterized=len(y_values) > _RASTER_POINT_THRESHOLD)
+        elif len(y_values) > 1:
+            ax.plot(date_numbers, y_values, marker='o', label='Veri')
         else:
-            ax.bar(date_numbers, self.df[self.y_column], width=20, label='Veri')  # width değerini periyoda göre ayarlayın
+            ax.bar(date_numbers, y_values, width=20, label='Veri')  # width değerini periyoda göre ayarlayın
 
         # Ortalama değeri hesapla ve ortalama çizgisini ekle
-        mean_value = self.df[self.y_column].mean()
-        ax.axhline(y=mean_value, color='r', linestyle='--', linewidth=2, label='Ortalama')
-
-        # X ekseni formatını periyoda göre ayarla
-        if self.x_label == 'Yıl':
-            ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y'))
-            plt.xticks(rotation=0)
-            offset = 366  # Bir yıl için
-        elif self.x_label == 'Ay':
-            ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-            plt.xticks(rotation=45, ha='right')
-            offset = 31  # Bir ay için
-        else:
-            ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-            plt.xticks(rotation=45, ha='right')
-            offset = 1  # Bir gün için
+        # (pandas'ın mean'i gibi eksik değerler atlanır; tüm değerler eksikse çizgi çizilmez)
+        if not np.isnan(y_values).all():
+            mean_value = np.nanmean(y_values)
+            ax.axhline(y=mean_value, color='r', linestyle='--', linewidth=2, label='Ortalama')
 
         # X ekseni limitlerini ayarla
         ax.set_xlim(date_numbers.min() - offset, date_numbers.max() + offset)
 
-        # FixedLocator kullanımı - tarihleri numaralara dönüştürdük
-        ax.xaxis.set_major_locator(FixedLocator(date_numbers))
+        if len(date_numbers) > _MAX_X_TICKS:
+            # Yoğun grafiklerde her nokta için etiket oluşturmak yerine tik aralığını matplotlib seçer
+            ax.xaxis.set_major_locator(AutoDateLocator(maxticks=_MAX_X_TICKS))
+            ax.xaxis.set_major_formatter(DateFormatter(date_format))
+        else:
+            # FixedLocator kullanımı - tarihleri numaralara dönüştürdük
+            ax.xaxis.set_major_locator(FixedLocator(date_numbers))
+            # Etiketler her tik için ayrı ayrı değil, tüm indeks için tek seferde biçimlendirilir
+            ax.xaxis.set_major_formatter(FixedFormatter(self.x_index.strftime(date_format)))
+        # Etiketler pyplot'un "geçerli figure" durumu yerine doğrudan axes üzerinden döndürülür
+        for label in ax.get_xticklabels():
+            label.set(rotation=rotation, horizontalalignment=ha)
 
         # Otomatik tarih formatlamasını etkinleştir
         ax.xaxis_date()
@@ -103,9 +345,8 @@ class LineGraphPlotter(GraphPlotter):
         ax.legend()
 
         self._set_common_properties(ax)
-        plt.tight_layout()
-        plt.savefig(fig_name + f".{save_format}", format=save_format)
-        plt.close()
+        fig.tight_layout()
+        save_figure(fig, fig_name + f".{save_format}", save_format)
 
 class YearlyGraphPlotter(LineGraphPlotter):
     def __init__(self, df: pd.DataFrame, title: str) -> None:
@@ -121,18 +362,14 @@ class YearlyGraphPlotter(LineGraphPlotter):
         """
         super().__init__(df, title, 'yearly_clicks', 'Yıl')
 
-    def plot(self, fig_name: str) -> None:
-        """
-        Yıllık grafiği çizen metot.
-
-        Args:
-            fig_name (str): Kaydedilecek dosyanın adı
-
-        Returns:
-            None
-        """
-        super().plot(fig_name)
-        plt.xticks(rotation=0)  # Yıl etiketlerini döndürmeye gerek yok
+# Periyotlara göre çizici sınıfları ve yapıcıya geçirilecek ek argümanlar
+# (her çağrıda sözlük ve lambda oluşturmamak için modül seviyesinde tanımlıdır)
+_PLOTTERS = {
+    'günlük': (LineGraphPlotter, ('daily_clicks', 'Tarih')),
+    'aylık': (LineGraphPlotter, ('monthly_clicks', 'Ay')),
+    'çeyreklik': (LineGraphPlotter, ('quarterly_clicks', 'Çeyrek')),
+    'yıllık': (YearlyGraphPlotter, ())
+}
 
 class GraphFactory:
     @staticmethod
@@ -148,15 +385,13 @@ class GraphFactory:
         Returns:
             GraphPlotter: Oluşturulan GraphPlotter nesnesi
         """
-        plotters = {
-            'günlük': lambda: LineGraphPlotter(df, title, 'daily_clicks', 'Tarih'),
-            'aylık': lambda: LineGraphPlotter(df, title, 'monthly_clicks', 'Ay'),
-            'çeyreklik': lambda: LineGraphPlotter(df, title, 'quarterly_clicks', 'Çeyrek'),
-            'yıllık': lambda: YearlyGraphPlotter(df, title)
-        }
-        return plotters.get(period, lambda: None)()
+        plotter = _PLOTTERS.get(period)
+        if plotter is None:
+            return None
+        plotter_class, args = plotter
+        return plotter_class(df, title, *args)
 
-def plot_graph(df: pd.DataFrame, period: str, title: str, fig_name: str) -> None:
+def plot_graph(df: pd.DataFrame, period: str, title: str, fig_name: str, save_format: str | None = None) -> None:
     """
     Belirtilen periyoda göre grafik çizen fonksiyon.
 
@@ -164,60 +399,116 @@ def plot_graph(df: pd.DataFrame, period: str, title: str, fig_name: str) -> None
         df (pd.DataFrame): Çizilecek veriyi içeren DataFrame
         period (str): Grafik periyodu
         title (str): Grafiğin başlığı
-        fig_name (str): Kaydedilecek dosyanın adı
+        fig_name (str): Kaydedilecek dosyanın yolu (uzantısız)
+        save_format (str | None): Kayıt biçimi ('svg', 'png' vb.); verilmezse 'svg' kullanılır
 
     Returns:
         None
     """
     plotter = GraphFactory.create_plotter(period, df, title)
     if plotter:
-        plotter.plot(fig_name)
+        import matplotlib
+        with matplotlib.rc_context(_RC_PARAMS):
+            plotter.plot(fig_name, save_format)
     else:
         raise ValueError(f"Invalid period: {period}")
 
-def plot_all_graphs(df: pd.DataFrame, plot_dir: str = 'plots') -> None:
+def plot_all_graphs(df: pd.DataFrame, plot_dir: str = 'plots', export_json: bool = False,
+                    save_format: str | None = None) -> None:
     """
     Tüm periyotlar için grafikleri çizen ve kaydeden fonksiyon.
 
     Args:
         df (pd.DataFrame): Çizilecek veriyi içeren DataFrame
         plot_dir (str): Grafiklerin kaydedileceği dizin, varsayılan değeri 'plots'
+        export_json (bool): True ise her grafiğin verisi aynı adla .json dosyasına da yazılır
+        save_format (str | None): Grafiklerin kayıt biçimi ('svg', 'png' vb.); verilmezse 'svg' kullanılır
 
     Returns:
         None
     """
     # Eğer belirtilen dizin yoksa, yeni bir dizin oluştur
-    if not os.path.exists(plot_dir):
-        os.makedirs(plot_dir)
-    
-    # Mevcut çalışma dizinini kaydet
-    old_dir = os.getcwd()
-    # Çalışma dizinini grafiklerin kaydedileceği dizine değiştir
-    os.chdir(plot_dir)
+    os.makedirs(plot_dir, exist_ok=True)
     
-    # Farklı periyotlar için hesaplama fonksiyonlarını tanımla
-    periods = {
-        'günlük': process_data_helper.calculate_daily_clicks,
-        'aylık': process_data_helper.calculate_monthly_clicks,
-        'çeyreklik': process_data_helper.calculate_quarterly_clicks,
-        'yıllık': process_data_helper.calculate_yearly_clicks
-    }
-    
-    # Her bir periyot için grafik çiz
-    for period, calculate_func in periods.items():
-        # İlgili periyot için tıklanma sayılarını hesapla
-        period_df = calculate_func(df)
-        # Eğer hesaplanan DataFrame boş değilse grafik çiz
+    # Tüm periyotlar ham veri tek kez gruplanarak hesaplanır; alt süreçlere yalnızca küçük periyot tabloları gönderilir
+    period_dfs = process_data_helper.calculate_all_period_clicks(df)
+    # Verisi son çizimden beri değişmeyen ve dosyası yerinde duran grafikler atlanır.
+    # Yeni bir görüntülenme tüm periyotların son değerini birlikte değiştirdiğinden bu yalnızca
+    # görüntülenme sayısının önceki döngüden beri hiç artmadığı döngülerde gerçekleşir
+    periods, stale_dfs = [], []
+    for period in _PERIOD_COLUMNS:
+        period_df = period_dfs[_PERIOD_COLUMNS[period]]
+        if not is_plot_up_to_date(get_plot_path(plot_dir, period), period_df, export_json, save_format):
+            periods.append(period)
+            stale_dfs.append(period_df)
+    if not periods:
+        return
+
+    # Her periyot bağımsız bir dosya ürettiği için grafikler ayrı süreçlerde paralel çizilir
+    global _EXECUTOR
+    try:
+        list(get_plot_executor().map(plot_period_graph, periods, stale_dfs, repeat(plot_dir), repeat(export_json), repeat(save_format)))
+    except BrokenProcessPool as e:
+        # Bir alt süreç beklenmedik şekilde sonlandıysa izleyici durdurulmaz; havuz sonraki çağrıda
+        # yeniden oluşturulur ve çizilemeyen grafikler bir sonraki döngüde tekrar denenir
+        print(f"\nGrafikler çizilirken bir alt süreç sonlandı: {e}")
+        _EXECUTOR = None
+        for period in periods:
+            _LAST_PLOTTED_DFS.pop(get_plot_path(plot_dir, period), None)
+        return
+
+    # Yalnızca başarıyla çizilen grafikler kaydedilir; boş veriler her döngüde yeniden bildirilir
+    for period, period_df in zip(periods, stale_dfs):
         if not period_df.empty:
-            # Grafik başlığını oluştur
-            title = f"{period.capitalize()} Tıklanma Sayısı"
-            # Kaydedilecek dosya adını oluştur
-            fig_name = f"{period}_clicks"
-            # Grafiği çiz ve kaydet
-            plot_graph(period_df, period, title, fig_name)
-        else:
-            # Eğer veri yoksa, konsola bilgi mesajı yazdır
-            print(f"No data available for {period} graph")
-    
-    # Çalışma dizinini eski haline getir
-    os.chdir(old_dir)
+            _LAST_PLOTTED_DFS[get_plot_path(plot_dir, period)] = period_df
+
+def get_plot_executor() -> ProcessPoolExecutor:
+    """
+    Grafik çizimi için kullanılan süreç havuzunu döndüren fonksiyon.
+    Havuz ilk çağrıda oluşturulur ve sonraki çağrılarda yeniden kullanılır;
+    böylece alt süreçler ve içlerindeki Figure nesneleri döngüler arasında korunur.
+
+    Returns:
+        ProcessPoolExecutor: Grafik çizim süreç havuzu
+    """
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        max_workers = min(len(_PERIOD_COLUMNS), _MAX_PLOT_WORKERS, os.cpu_count() or 1)
+        # Ctrl+C yalnızca ana süreçte işlenir; alt süreçler SIGINT'i yok sayar ve
+        # kapanışta atexit ile sonlandırılır
+        _EXECUTOR = ProcessPoolExecutor(max_workers=max_workers, initializer=signal.signal,
+                                        initargs=(signal.SIGINT, signal.SIG_IGN))
+        # Program kapanırken alt süreçleri düzgünce sonlandır
+        atexit.register(_EXECUTOR.shutdown)
+    return _EXECUTOR
+
+def plot_period_graph(period: str, period_df: pd.DataFrame, plot_dir: str, export_json: bool = False,
+                      save_format: str | None = None) -> None:
+    """
+    Tek bir periyodun tıklanma sayılarının grafiğini kaydeden fonksiyon.
+    Alt süreçlerde çalıştırılabilmesi için modül seviyesinde tanımlıdır.
+
+    Args:
+        period (str): Grafik periyodu
+        period_df (pd.DataFrame): Periyodun tıklanma sayılarını içeren DataFrame
+        plot_dir (str): Grafiğin kaydedileceği dizin
+        export_json (bool): True ise grafiğin verisi .json dosyasına da yazılır
+        save_format (str | None): Grafiğin kayıt biçimi; verilmezse 'svg' kullanılır
+
+    Returns:
+        None
+    """
+    # Eğer hesaplanan DataFrame boş değilse grafik çiz
+    if not period_df.empty:
+        # Grafik başlığını oluştur
+        title = f"{period.capitalize()} Tıklanma Sayısı"
+        # Kaydedilecek dosya yolunu oluştur (çalışma dizini değiştirilmez)
+        fig_name = get_plot_path(plot_dir, period)
+        # Grafiği çiz ve kaydet
+        plot_graph(period_df, period, title, fig_name, save_format)
+        # İstenirse verinin kendisini de istemci tarafında çizilmek üzere kaydet
+        if export_json:
+            save_json(fig_name + ".json", export_plot_data(period_df, _PERIOD_COLUMNS[period]))
+    else:
+        # Eğer veri yoksa, konsola bilgi mesajı yazdır
+        print(f"No data available for {period} graph")
@@ -1,5 +1,6 @@
 import pandas as pd
 import typing
+from constants import TIMESTAMP_FORMAT
 
 if typing.TYPE_CHECKING:
     from gspread import Spreadsheet
@@ -23,24 +24,30 @@ def read_and_preprocess_data(sheet: 'Spreadsheet') -> pd.DataFrame:
     if not data:
         raise ValueError("Sheet boş veya veri içermiyor.")
     
-    # İlk satır sütun isimleri değilse, sütun isimlerini ekle
-    if data[0] != ['timestamp', 'number']:
-        data.insert(0, ['timestamp', 'number'])
-    
-    # DataFrame oluştur
-    df = pd.DataFrame(data[1:], columns=data[0])
+    # İlk satır sütun isimleriyse atla (listenin başına satır eklemek tüm listeyi kaydırır)
+    rows = data[1:] if data[0] == ['timestamp', 'number'] else data
     
+    # Sütunlar önce metin tablosu oluşturulmadan doğrudan tipli olarak dönüştürülür
     # 'number' sütununun sayısal olduğundan emin ol
-    df['number'] = pd.to_numeric(df['number'], errors='coerce')
+    numbers = pd.to_numeric([row[1] for row in rows], errors='coerce')
     
     # Zaman damgasını datetime formatına çevir
-    df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
+    # Biçim açıkça verildiği için pandas her değer için biçim tahmini yapmaz, tekrar eden değerler önbellekten gelir
+    timestamps = pd.to_datetime([row[0] for row in rows], format=TIMESTAMP_FORMAT, errors='coerce', cache=True)
+    
+    # DataFrame oluştur
+    df = pd.DataFrame({'timestamp': timestamps, 'number': numbers})
     
     # Geçersiz tarih veya sayı değerlerini içeren satırları at
     df = df.dropna(subset=['timestamp', 'number'])
     
     # Verileri zaman damgasına göre sırala
-    df = df.sort_values('timestamp')
+    # Sayfaya kayıtlar zaman sırasıyla eklendiği için veri çoğunlukla zaten sıralıdır; bu durumda sıralama atlanır
+    if df['timestamp'].is_monotonic_increasing:
+        df = df.reset_index(drop=True)
+    else:
+        # (kararlı sıralama aynı zaman damgalı kayıtların sayfadaki sırasını korur)
+        df = df.sort_values('timestamp', kind='stable', ignore_index=True)
     return df
 
 def calculate_daily_clicks(df: pd.DataFrame) -> pd.DataFrame:
@@ -55,21 +62,66 @@ def calculate_daily_clicks(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Günlük tıklanma sayılarını içeren DataFrame.
     """
-    df = df.copy()
-    
-    # Zaman damgası sütununu datetime formatına çevir
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
-    # Tarih bilgisini ayrı bir sütuna al
-    df['date'] = df['timestamp'].dt.normalize()
+    # Zaman damgası sütunu datetime formatında değilse çevir
+    # (read_and_preprocess_data çıktısı zaten datetime olduğundan tüm tablo kopyalanıp yeniden ayrıştırılmaz)
+    if not pd.api.types.is_datetime64_any_dtype(df['timestamp']):
+        df = df.assign(timestamp=pd.to_datetime(df['timestamp']))
     
     # Her gün için ilk ve son tık sayılarını al
-    daily_clicks = get_daily_first_last(df)
+    daily_first_last = get_daily_first_last(add_date_column(df))
     
+    return calculate_daily_clicks_from_first_last(daily_first_last)
+
+def calculate_all_period_clicks(df: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    """
+    Günlük, aylık, çeyreklik ve yıllık tıklanma sayılarını birlikte hesaplar.
+    Ham veri yalnızca bir kez gruplanır; diğer periyotlar günlük ilk/son değerlerden türetilir.
+
+    Args:
+        df (pd.DataFrame): İşlenmiş veriyi içeren DataFrame.
+
+    Returns:
+        dict[str, pd.DataFrame]: Sütun adına ('daily_clicks', 'monthly_clicks', 'quarterly_clicks',
+        'yearly_clicks') göre periyot tıklanma sayılarını içeren DataFrame'ler.
+    """
+    daily_first_last = get_daily_first_last(add_date_column(df))
+    return {
+        'daily_clicks': calculate_daily_clicks_from_first_last(daily_first_last),
+        'monthly_clicks': calculate_period_clicks(daily_first_last, 'M', 'monthly_clicks'),
+        'quarterly_clicks': calculate_period_clicks(daily_first_last, 'Q', 'quarterly_clicks'),
+        'yearly_clicks': calculate_period_clicks(daily_first_last, 'Y', 'yearly_clicks')
+    }
+
+def add_date_column(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Zaman damgasının gün kısmını içeren 'date' sütununu ekler.
+    Verilen DataFrame değiştirilmez, sütunu eklenmiş yeni bir DataFrame döndürülür.
+
+    Args:
+        df (pd.DataFrame): İşlenmiş veriyi içeren DataFrame.
+
+    Returns:
+        pd.DataFrame: 'date' sütunu eklenmiş DataFrame.
+    """
+    return df.assign(date=df['timestamp'].dt.normalize())
+
+def calculate_daily_clicks_from_first_last(daily_first_last: pd.DataFrame) -> pd.DataFrame:
+    """
+    Günlük ilk ve son tık sayılarından, eksik günleri tahmin ederek günlük tıklanma sayısını hesaplar.
+
+    Args:
+        daily_first_last (pd.DataFrame): Veri olan her gün için ilk ve son tık sayılarını içeren DataFrame.
+
+    Returns:
+        pd.DataFrame: Günlük tıklanma sayılarını içeren DataFrame.
+    """
+    daily_clicks = daily_first_last.copy()
+
     # Günlük tıklanma sayısını hesapla
     daily_clicks['daily_clicks'] = calculate_daily_clicks_difference(daily_clicks)
     
     # Tüm tarih aralığını kapsayacak şekilde yeniden indeksleme yap
-    all_dates = pd.date_range(start=df['date'].min(), end=df['date'].max(), freq='D')
+    all_dates = pd.date_range(start=daily_clicks.index.min(), end=daily_clicks.index.max(), freq='D')
     daily_clicks = daily_clicks.reindex(all_dates)
     daily_clicks.index.name = 'date'
     
@@ -121,69 +173,52 @@ def fill_missing_clicks(daily_clicks: pd.DataFrame) -> pd.Series:
     clicks = daily_clicks['daily_clicks']
     is_missing = clicks.isna()
     
-    # Eksik günlerin tarihlerini al
-    missing_dates = clicks[is_missing].index
+    # Her gün için önceki (son değeri olan) ve sonraki (ilk değeri olan) veri günlerini tek seferde bul;
+    # eksik günlerde bu değerler NaN olduğundan ileri/geri doldurma en yakın veri gününü verir
+    dates = daily_clicks.index.to_series()
+    prev_dates = dates.where(daily_clicks['last'].notna()).ffill()
+    next_dates = dates.where(daily_clicks['first'].notna()).bfill()
+    prev_last = daily_clicks['last'].ffill()
+    next_first = daily_clicks['first'].bfill()
     
-    # Eksik günler için tıklanma sayılarını tahmin et
-    for missing_date in missing_dates:
-        # Önceki ve sonraki veri olan tarihleri bul
-        prev_date = find_prev_date_with_data(daily_clicks, missing_date)
-        next_date = find_next_date_with_data(daily_clicks, missing_date)
-        
-        if prev_date and next_date:
-            # Toplam gün sayısı (eksik günler dahil)
-            total_days = (next_date - prev_date).days
-            # Toplam tıklanma sayısı farkı
-            total_clicks = daily_clicks.at[next_date, 'first'] - daily_clicks.at[prev_date, 'last']
-            # Günlük ortalama tıklanma sayısı
-            avg_clicks = total_clicks / total_days
-            # Eksik günün tıklanma sayısını belirle
-            clicks.at[missing_date] = avg_clicks
-        else:
-            # Önceki veya sonraki tarih yoksa tıklanma sayısını 0 olarak kabul et
-            clicks.at[missing_date] = 0
+    # Eksik günün tıklanma sayısı, önceki ve sonraki veri günleri arasındaki toplam farkın
+    # gün sayısına bölümüdür; önceki veya sonraki tarih yoksa tıklanma sayısı 0 kabul edilir
+    avg_clicks = ((next_first - prev_last) / (next_dates - prev_dates).dt.days).fillna(0)
     
-    return clicks
+    return clicks.mask(is_missing, avg_clicks)
 
-def find_prev_date_with_data(daily_clicks: pd.DataFrame, current_date: pd.Timestamp) -> pd.Timestamp or None:
+def calculate_period_clicks(daily_first_last: pd.DataFrame, freq: str, column: str) -> pd.DataFrame:
     """
-    Mevcut tarihten önceki veri içeren en yakın tarihi bulur.
-    
-    Args:
-        daily_clicks (pd.DataFrame): Günlük tıklanma sayılarını içeren DataFrame.
-        current_date (pd.Timestamp): Mevcut tarih.
-    
-    Returns:
-        pd.Timestamp veya None: Önceki veri içeren tarih veya None.
-    """
-    # Mevcut tarihten önceki tarihleri al
-    prev_dates = daily_clicks.loc[:current_date].iloc[:-1]
-    # Veri olan tarihleri filtrele
-    prev_dates = prev_dates[prev_dates['last'].notna()]
-    if not prev_dates.empty:
-        return prev_dates.index[-1]
-    else:
-        return None
+    Günlük ilk ve son tık sayılarından verilen periyottaki tıklanma sayısını hesaplar.
+    Her periyodun tıklanma sayısı, son değerinden bir önceki periyodun son değeri çıkarılarak bulunur;
+    önceki periyot yoksa periyodun ilk değeri kullanılır.
 
-def find_next_date_with_data(daily_clicks: pd.DataFrame, current_date: pd.Timestamp) -> pd.Timestamp or None:
-    """
-    Mevcut tarihten sonraki veri içeren en yakın tarihi bulur.
-    
     Args:
-        daily_clicks (pd.DataFrame): Günlük tıklanma sayılarını içeren DataFrame.
-        current_date (pd.Timestamp): Mevcut tarih.
-    
+        daily_first_last (pd.DataFrame): Veri olan her gün için ilk ve son tık sayılarını içeren DataFrame.
+        freq (str): Periyot sıklığı ('M': ay, 'Q': çeyrek, 'Y': yıl).
+        column (str): Sonuç sütununun adı.
+
     Returns:
-        pd.Timestamp veya None: Sonraki veri içeren tarih veya None.
+        pd.DataFrame: Periyot başlangıç tarihine göre indekslenmiş tıklanma sayılarını içeren DataFrame.
     """
-    # Mevcut tarihten sonraki tarihleri al
-    next_dates = daily_clicks.loc[current_date:].iloc[1:]
-    # Veri olan tarihleri filtrele
-    next_dates = next_dates[next_dates['first'].notna()]
-    if not next_dates.empty:
-        return next_dates.index[0]
-    else:
-        return None
+    # Günlük değerleri periyoda göre grupla; periyodun ilk değeri ilk günün ilk değeri,
+    # son değeri ise son günün son değeridir
+    period_clicks_df = daily_first_last.groupby(daily_first_last.index.to_period(freq)).agg(
+        first=('first', 'first'),
+        last=('last', 'last')
+    )
+
+    # Bir önceki periyodun son değerini hesapla
+    prev_period_last = period_clicks_df['last'].shift(1)
+
+    # Periyot tıklanma sayısını hesapla (satır satır apply yerine tek vektörel işlem)
+    period_clicks_df[column] = period_clicks_df['last'] - prev_period_last.fillna(period_clicks_df['first'])
+
+    # İndeksi datetime formatına dönüştür
+    period_clicks_df.index = period_clicks_df.index.to_timestamp()
+
+    return period_clicks_df[[column]]
+
 def calculate_monthly_clicks(df: pd.DataFrame) -> pd.DataFrame:
     """
     Aylık tıklanma sayısını timestamp sütunundan hesaplar.
@@ -194,21 +229,7 @@ def calculate_monthly_clicks(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Aylık tıklanma sayılarını içeren DataFrame.
     """
-    # 'timestamp' sütunundan ay bilgisini çıkar ve aylık gruplandırma yap
-    monthly_clicks_df = df.groupby(df['timestamp'].dt.to_period('M'))['number'].agg(['first', 'last'])
-    
-    # Bir önceki ayın son değerini hesapla
-    monthly_clicks_df['prev_month_last'] = monthly_clicks_df['last'].shift(1)
-    
-    # Aylık tıklanma sayısını hesapla
-    monthly_clicks_df['monthly_clicks'] = monthly_clicks_df.apply(
-        lambda row: row['last'] - (row['prev_month_last'] if pd.notnull(row['prev_month_last']) else row['first']),
-        axis=1
-    )
-    # İndeksi datetime formatına dönüştür
-    monthly_clicks_df.index = monthly_clicks_df.index.to_timestamp()
-    
-    return monthly_clicks_df[['monthly_clicks']]
+    return calculate_period_clicks(get_daily_first_last(add_date_column(df)), 'M', 'monthly_clicks')
 
 def calculate_quarterly_clicks(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -220,20 +241,8 @@ def calculate_quarterly_clicks(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: 3 aylık tıklanma sayılarını içeren DataFrame.
     """
-    # 'timestamp' sütunundan çeyrek bilgisini çıkar ve çeyreklik gruplandırma yap
-    quarterly_clicks_df = df.groupby(df['timestamp'].dt.to_period('Q'))['number'].agg(['first', 'last'])
-    
-    # Bir önceki çeyreğin son değerini hesapla
-    quarterly_clicks_df['prev_quarter_last'] = quarterly_clicks_df['last'].shift(1)
-    
-    # Çeyreklik tıklanma sayısını hesapla
-    quarterly_clicks_df['quarterly_clicks'] = quarterly_clicks_df.apply(
-        lambda row: row['last'] - (row['prev_quarter_last'] if pd.notnull(row['prev_quarter_last']) else row['first']),
-        axis=1
-    )
-    # İndeksi datetime formatına dönüştür
-    quarterly_clicks_df.index = quarterly_clicks_df.index.to_timestamp()
-    return quarterly_clicks_df[['quarterly_clicks']]
+    return calculate_period_clicks(get_daily_first_last(add_date_column(df)), 'Q', 'quarterly_clicks')
+
 def calculate_yearly_clicks(df: pd.DataFrame) -> pd.DataFrame:
     """
     Yıllık tıklanma sayısını timestamp sütunundan hesaplar.
@@ -244,30 +253,7 @@ def calculate_yearly_clicks(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Yıllık tıklanma sayılarını içeren DataFrame.
     """
-    # 'timestamp' sütunundan yıl bilgisini çıkar ve yıllık gruplandırma yap
-    # df'yi değiştirmek yerine, gruplandırma için geçici bir yıl serisi oluşturuyoruz
-    year_series = df['timestamp'].dt.year
-    yearly_clicks_df = df.groupby(year_series)['number'].agg(['first', 'last'])
-
-    # Bir önceki yılın son değerini hesapla
-    yearly_clicks_df['prev_year_last'] = yearly_clicks_df['last'].shift(1)
-
-    # Yıllık tıklanma sayısını hesapla
-    def calculate_yearly_clicks_row(row):
-        if pd.notnull(row['prev_year_last']):
-            return row['last'] - row['prev_year_last']
-        else:
-            return row['last'] - row['first']
-
-    yearly_clicks_df['yearly_clicks'] = yearly_clicks_df.apply(
-        calculate_yearly_clicks_row,
-        axis=1
-    )
-
-    # İndeksi datetime formatına dönüştür
-    yearly_clicks_df.index = pd.to_datetime(yearly_clicks_df.index.astype(str), format='%Y')
-
-    return yearly_clicks_df[['yearly_clicks']]
+    return calculate_period_clicks(get_daily_first_last(add_date_column(df)), 'Y', 'yearly_clicks')
 
 
 
@@ -281,31 +267,26 @@ def calculate_average_clicks(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Her gün için 2 saatlik ortalama tıklanma sayılarını içeren DataFrame.
     """
-    # 2 saatlik ortalama tıklanma sayısını hesapla
-    average_clicks_list = []
-    
-    for date in df['date'].unique():
-        # Belirli bir günün verilerini al
-        day_data = df[df['date'] == date].copy()
-        day_data.set_index('timestamp', inplace=True)
-        
-        # 'number' sütunundaki farkları hesapla
-        day_data['number_diff'] = day_data['number'].diff()
-        day_data['number_diff'] = day_data['number_diff'].clip(lower=0)  # Negatif farkları sıfırla
-        
-        # 2 saatlik aralıklarla verileri yeniden örnekle ve tıklanma sayılarını topla
-        resampled = day_data['number_diff'].resample('2h').sum()
-        
-        # 2 saatlik periyotların ortalamasını al
-        if not resampled.empty:
-            average_clicks = resampled.mean()
-        else:
-            average_clicks = 0  # Veri yoksa ortalama tıklanma sayısını 0 olarak al
-        
-        average_clicks_list.append({'date': date, 'average_clicks': average_clicks})
-    
+    # Her gün içinde ardışık kayıtlar arasındaki farkları hesapla, negatif farkları sıfırla
+    number_diff = df.groupby('date', sort=False)['number'].diff().clip(lower=0)
+
+    # Her kaydın düştüğü 2 saatlik aralığın başlangıcı (aralıklar gece yarısından itibaren hizalanır)
+    interval_start = df['timestamp'].dt.floor('2h')
+
+    # Günlük döngü yerine tüm günler tek gruplamayla işlenir
+    grouped = pd.DataFrame({
+        'date': df['date'],
+        'number_diff': number_diff,
+        'interval_start': interval_start
+    }).groupby('date', sort=False)
+
+    # 2 saatlik aralıkların ortalaması, günün toplam tıklanmasının günün ilk ve son kaydı arasındaki
+    # aralık sayısına bölümüdür (kayıt olmayan aralıklar 0 tıklanma olarak sayılır)
+    total_clicks = grouped['number_diff'].sum()
+    interval_count = (grouped['interval_start'].max() - grouped['interval_start'].min()) / pd.Timedelta(hours=2) + 1
+
     # Sonuçları DataFrame şeklinde düzenle
-    average_clicks_df = pd.DataFrame(average_clicks_list)
-    average_clicks_df.set_index('date', inplace=True)
+    average_clicks_df = (total_clicks / interval_count).to_frame('average_clicks')
+    average_clicks_df.index.name = 'date'
     
     return average_clicks_df
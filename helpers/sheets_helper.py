@@ -1,14 +1,47 @@
-import gspread
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
-from constants import CREDENTIAL_FILE
+import functools
+from constants import CREDENTIAL_FILE, TIMESTAMP_FORMAT
 from datetime import datetime
 from typing import Union, Tuple, Any
+import typing
+if typing.TYPE_CHECKING:
+    import gspread
 # API'ler için kapsamları tanımlayın
 scopes = ["https://www.googleapis.com/auth/spreadsheets", "https://www.googleapis.com/auth/drive"]
-creds = Credentials.from_service_account_file(CREDENTIAL_FILE, scopes=scopes)
-client = gspread.authorize(creds)
-drive_service = build('drive', 'v3', credentials=creds)
+
+# İstemciler modül yüklenirken değil ilk kullanımda oluşturulur; böylece paketi yalnızca grafik
+# çizmek için içe aktaran alt süreçler kimlik doğrulama ve API istemcisi kurulumunu tekrarlamaz
+@functools.lru_cache(maxsize=1)
+def get_credentials() -> Any:
+    """
+    Servis hesabı kimlik bilgilerini bir kez yükleyip döndürür.
+
+    Returns:
+        Credentials: Google API'leri için servis hesabı kimlik bilgileri.
+    """
+    from google.oauth2.service_account import Credentials
+    return Credentials.from_service_account_file(CREDENTIAL_FILE, scopes=scopes)
+
+@functools.lru_cache(maxsize=1)
+def get_client() -> 'gspread.Client':
+    """
+    Yetkilendirilmiş gspread istemcisini bir kez oluşturup döndürür.
+
+    Returns:
+        gspread.Client: Google Sheets istemcisi.
+    """
+    import gspread
+    return gspread.authorize(get_credentials())
+
+@functools.lru_cache(maxsize=1)
+def get_drive_service() -> Any:
+    """
+    Google Drive API istemcisini bir kez oluşturup döndürür.
+
+    Returns:
+        Any: Google Drive v3 servis nesnesi.
+    """
+    from googleapiclient.discovery import build
+    return build('drive', 'v3', credentials=get_credentials())
 
 
 def configure_sheet_permissions(file_id: str, spreadsheet: Any, writer_emails: list[str]) -> None:
@@ -71,7 +104,7 @@ def setup_spreadsheet(spreadsheet_name: str) -> tuple[Any, Any, str]:
 
 
 
-def create_sheets(spreadsheet_name: str, mime_type: str) -> gspread.Spreadsheet:
+def create_sheets(spreadsheet_name: str, mime_type: str) -> 'gspread.Spreadsheet':
     """
     Yeni bir Google Sheet oluşturur ve döndürür.
 
@@ -86,7 +119,7 @@ def create_sheets(spreadsheet_name: str, mime_type: str) -> gspread.Spreadsheet:
         'name': spreadsheet_name,
         'mimeType': mime_type
     }
-    spreadsheet = drive_service.files().create(body=file_metadata, fields='id').execute()
+    spreadsheet = get_drive_service().files().create(body=file_metadata, fields='id').execute()
     return spreadsheet
 
 def create_public_access_permission() -> dict:
@@ -109,7 +142,7 @@ def apply_permission(file_id: str, permission: dict):
         file_id (str): Erişim izni verilecek dosyanın kimliği.
         permission (dict): Uygulanacak izin sözlüğü.
     """
-    drive_service.permissions().create(
+    get_drive_service().permissions().create(
         fileId=file_id,
         body=permission
     ).execute()
@@ -127,7 +160,7 @@ def is_sheet_exists(spreadsheet_name: str, mime_type:str) -> tuple[bool, str | N
                ikinci eleman olarak dosya kimliği (str) veya None.
                True ise dosya kimliği döner, False ise None döner.
     """
-    file_list = drive_service.files().list(
+    file_list = get_drive_service().files().list(
         q=f"name='{spreadsheet_name}' and mimeType='{mime_type}'",
         fields="files(id, name)"
     ).execute()
@@ -137,7 +170,7 @@ def is_sheet_exists(spreadsheet_name: str, mime_type:str) -> tuple[bool, str | N
     return False, None
 
 
-def get_spreadsheet(spreadsheet_name: str, mime_type: str) -> gspread.Spreadsheet:
+def get_spreadsheet(spreadsheet_name: str, mime_type: str) -> 'gspread.Spreadsheet':
     """
     Belirtilen isimdeki Google Sheet'i alır ve döndürür. Eğer yoksa yeni bir tane oluşturur.
 
@@ -151,12 +184,12 @@ def get_spreadsheet(spreadsheet_name: str, mime_type: str) -> gspread.Spreadshee
     exists, file_id = is_sheet_exists(spreadsheet_name, mime_type)
     if exists:
         # Var olan dosyayı aç
-        spreadsheet = client.open_by_key(file_id)
+        spreadsheet = get_client().open_by_key(file_id)
     else:
         # Dosya yoksa yeni bir dosya oluştur
         spreadsheet = create_sheets(spreadsheet_name, mime_type)
     return spreadsheet
-def append_to_sheet(sheet: gspread.Worksheet, input_value: Union[str, int, float], value_threshold: Union[int, float] = 2) -> Tuple[bool, bool, datetime | str]:
+def append_to_sheet(sheet: 'gspread.Worksheet', input_value: Union[str, int, float], value_threshold: Union[int, float] = 2) -> Tuple[bool, bool, datetime | str]:
     """
     Verilen değeri (string, int veya float) ve anlık tarihi, sheet dosyasının son satırına ekler veya günceller.
     Eğer son satırın 2. sütunu aynı değere sahipse, o satırı günceller; değilse yeni bir satır ekler.
@@ -175,7 +208,7 @@ def append_to_sheet(sheet: gspread.Worksheet, input_value: Union[str, int, float
     try:
         # Anlık tarihi al ve formatla
         current_date = datetime.now()
-        current_date_str = current_date.strftime("%Y-%m-%d %H:%M:%S")
+        current_date_str = current_date.strftime(TIMESTAMP_FORMAT)
         
         is_appended = update_sheet(sheet, sheet.get_all_values(), input_value, current_date_str, value_threshold)
         
@@ -238,7 +271,7 @@ def update_sheet(sheet: object, all_values: list, input_value: float, current_da
 
 
 
-def share_sheet_with_emails(sheet: gspread.Spreadsheet, email_addresses: list[str]):
+def share_sheet_with_emails(sheet: 'gspread.Spreadsheet', email_addresses: list[str]):
     """
     Verilen e-posta adreslerine sheet üzerinde "writer" yetkisi verir.
     Eğer e-posta adresine zaten "writer" yetkisi verilmişse tekrar vermeye çalışmaz.